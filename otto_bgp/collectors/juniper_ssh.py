@@ -10,11 +10,13 @@ Modern implementation of SSH-based BGP data collection with:
 """
 
 import csv
+import dataclasses
 import logging
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import paramiko
 
@@ -27,6 +29,13 @@ from otto_bgp.utils.parallel import ParallelExecutor
 # Import secure host key verification
 from otto_bgp.utils.ssh_security import get_host_key_policy
 
+# Parsed device inventories keyed on (resolved path, mtime_ns, size) so that
+# repeated loads of an unchanged CSV skip the DictReader pass entirely. Each
+# entry also keeps the per-row (level, message) log lines so hits repeat them
+_DEVICE_CSV_CACHE: Dict[Tuple[str, int, int], Tuple[List[DeviceInfo], List[Tuple[int, str]]]] = {}
+_DEVICE_CSV_CACHE_MAX = 8
+_device_csv_cache_lock = threading.Lock()
+
 
 @dataclass
 class BGPPeerData:
@@ -156,8 +165,22 @@ class JuniperSSHCollector:
             if not csv_file.exists():
                 raise FileNotFoundError(f"Device CSV not found: {csv_path}")
 
+            stat = csv_file.stat()
+            cache_key = (str(csv_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            with _device_csv_cache_lock:
+                cached = _DEVICE_CSV_CACHE.get(cache_key)
+            if cached is not None:
+                cached_devices, cached_row_messages = cached
+                self.logger.debug(f"Using cached device inventory for {csv_path}")
+                # Repeat the row warnings so a cached load doesn't look cleaner than the file is
+                for level, message in cached_row_messages:
+                    self.logger.log(level, message)
+                # Hand out copies so callers cannot mutate the cached entries
+                return [dataclasses.replace(device) for device in cached_devices]
+
             devices = []
             hostnames_seen = set()
+            row_messages = []
 
             # Try with csv module for better control
             with open(csv_file, 'r', newline='') as file:
@@ -177,7 +200,9 @@ class JuniperSSHCollector:
 
                         # Check for duplicate hostnames
                         if device.hostname in hostnames_seen:
-                            self.logger.warning(f"Duplicate hostname '{device.hostname}' in row {row_num}, auto-generating unique name")
+                            message = f"Duplicate hostname '{device.hostname}' in row {row_num}, auto-generating unique name"
+                            self.logger.warning(message)
+                            row_messages.append((logging.WARNING, message))
                             device.hostname = f"{device.hostname}-{row_num}"
 
                         hostnames_seen.add(device.hostname)
@@ -186,7 +211,9 @@ class JuniperSSHCollector:
                         self.logger.debug(f"Loaded device: {device.hostname} ({device.address})")
 
                     except Exception as e:
-                        self.logger.error(f"Invalid device in CSV row {row_num}: {e}")
+                        message = f"Invalid device in CSV row {row_num}: {e}"
+                        self.logger.error(message)
+                        row_messages.append((logging.ERROR, message))
                         continue
 
             if not devices:
@@ -194,6 +221,14 @@ class JuniperSSHCollector:
 
             self.logger.info(f"Loaded {len(devices)} devices from {csv_path}")
 
+            with _device_csv_cache_lock:
+                # Drop stale entries for this path before inserting the fresh parse
+                for key in [k for k in _DEVICE_CSV_CACHE if k[0] == cache_key[0]]:
+                    del _DEVICE_CSV_CACHE[key]
+                while len(_DEVICE_CSV_CACHE) >= _DEVICE_CSV_CACHE_MAX:
+                    del _DEVICE_CSV_CACHE[next(iter(_DEVICE_CSV_CACHE))]
+                _DEVICE_CSV_CACHE[cache_key] = ([dataclasses.replace(device) for device in devices], row_messages)
+
             return devices
 
         except Exception as e:
@@ -8,7 +8,7 @@ groups, AS numbers, and peer relationships from router configurations.
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Set, Tuple
 
 from ..models import RouterProfile
 
@@ -41,7 +41,8 @@ class RouterInspector:
         self._compiled_patterns = {
             'group_pattern': re.compile(r'group\s+(\S+)\s*\{'),
             'peer_as_pattern': re.compile(r'peer-as\s+(\d+);'),
-            'external_as_pattern': re.compile(r'external-as\s+(\d+);')
+            'external_as_pattern': re.compile(r'external-as\s+(\d+);'),
+            'brace_pattern': re.compile(r'[{}]')
         }
 
     def discover_bgp_groups(self, bgp_config: str) -> Dict[str, List[int]]:
@@ -68,25 +69,7 @@ class RouterInspector:
             Returns:
                 {"external-peers": [65001, 65002]}
         """
-        groups = {}
-
-        # Find all group statements using pre-compiled pattern
-        for match in self._compiled_patterns['group_pattern'].finditer(bgp_config):
-            group_name = match.group(1)
-            start_pos = match.end() - 1  # Position of opening brace
-
-            # Find matching closing brace by counting braces
-            group_content = self._extract_block_content(bgp_config, start_pos)
-
-            if group_content:
-                # Extract AS numbers from peer-as statements within the group
-                as_numbers = self._extract_as_numbers_from_group(group_content)
-
-                if as_numbers:
-                    groups[group_name] = sorted(list(as_numbers))
-                    self.logger.info(f"Discovered BGP group '{group_name}' with AS numbers: {groups[group_name]}")
-
-        return groups
+        return self._groups_from_blocks(self._iter_group_blocks(bgp_config))
 
     def extract_peer_relationships(self, bgp_config: str) -> Dict[int, str]:
         """
@@ -101,24 +84,7 @@ class RouterInspector:
         Example:
             Returns: {65001: "external-peers", 65002: "external-peers", 13335: "cdn-peers"}
         """
-        relationships = {}
-
-        # Find all group statements using pre-compiled pattern
-        for match in self._compiled_patterns['group_pattern'].finditer(bgp_config):
-            group_name = match.group(1)
-            start_pos = match.end() - 1  # Position of opening brace
-
-            # Find matching closing brace by counting braces
-            group_content = self._extract_block_content(bgp_config, start_pos)
-
-            if group_content:
-                # Find all peer-as statements using pre-compiled pattern
-                for as_match in self._compiled_patterns['peer_as_pattern'].finditer(group_content):
-                    as_number = int(as_match.group(1))
-                    if self._is_valid_as_number(as_number):
-                        relationships[as_number] = group_name
-
-        return relationships
+        return self._relationships_from_blocks(self._iter_group_blocks(bgp_config))
 
     def identify_bgp_version(self, bgp_config: str) -> str:
         """
@@ -156,11 +122,14 @@ class RouterInspector:
             return result
 
         try:
+            # Locate group blocks once and derive groups and relationships from them
+            group_blocks = list(self._iter_group_blocks(router_profile.bgp_config))
+
             # Discover BGP groups
-            result.bgp_groups = self.discover_bgp_groups(router_profile.bgp_config)
+            result.bgp_groups = self._groups_from_blocks(group_blocks)
 
             # Extract peer relationships
-            result.peer_relationships = self.extract_peer_relationships(router_profile.bgp_config)
+            result.peer_relationships = self._relationships_from_blocks(group_blocks)
 
             # Identify BGP version
             result.bgp_version = self.identify_bgp_version(router_profile.bgp_config)
@@ -189,6 +158,53 @@ class RouterInspector:
 
         return result
 
+    def _iter_group_blocks(self, bgp_config: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (group name, group content) for each non-empty BGP group block.
+
+        Args:
+            bgp_config: Raw BGP configuration text
+
+        Returns:
+            Iterator of (group name, content between the group's braces)
+        """
+        # Find all group statements using pre-compiled pattern
+        for match in self._compiled_patterns['group_pattern'].finditer(bgp_config):
+            start_pos = match.end() - 1  # Position of opening brace
+
+            # Find matching closing brace by counting braces
+            group_content = self._extract_block_content(bgp_config, start_pos)
+
+            if group_content:
+                yield match.group(1), group_content
+
+    def _groups_from_blocks(self, group_blocks) -> Dict[str, List[int]]:
+        """Map group names to sorted AS numbers for the given group blocks."""
+        groups = {}
+
+        for group_name, group_content in group_blocks:
+            # Extract AS numbers from peer-as statements within the group
+            as_numbers = self._extract_as_numbers_from_group(group_content)
+
+            if as_numbers:
+                groups[group_name] = sorted(list(as_numbers))
+                self.logger.info(f"Discovered BGP group '{group_name}' with AS numbers: {groups[group_name]}")
+
+        return groups
+
+    def _relationships_from_blocks(self, group_blocks) -> Dict[int, str]:
+        """Map peer AS numbers to their group names for the given group blocks."""
+        relationships = {}
+
+        for group_name, group_content in group_blocks:
+            # Find all peer-as statements using pre-compiled pattern
+            for as_match in self._compiled_patterns['peer_as_pattern'].finditer(group_content):
+                as_number = int(as_match.group(1))
+                if self._is_valid_as_number(as_number):
+                    relationships[as_number] = group_name
+
+        return relationships
+
     def _extract_as_numbers_from_group(self, group_content: str) -> Set[int]:
         """
         Extract AS numbers from within a BGP group configuration.
@@ -242,19 +258,16 @@ class RouterInspector:
             return ""
 
         brace_count = 0
-        end_pos = start_pos
 
-        for i in range(start_pos, len(text)):
-            if text[i] == '{':
+        # Jump between braces with the regex engine rather than stepping
+        # through every character in Python
+        for match in self._compiled_patterns['brace_pattern'].finditer(text, start_pos):
+            if match.group() == '{':
                 brace_count += 1
-            elif text[i] == '}':
+            else:
                 brace_count -= 1
                 if brace_count == 0:
-                    end_pos = i
-                    break
-
-        if end_pos > start_pos:
-            return text[start_pos + 1:end_pos]
+                    return text[start_pos + 1:match.start()]
 
         return ""
 
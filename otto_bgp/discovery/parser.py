@@ -10,6 +10,33 @@ import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set
 
+# Pre-compile all regex patterns once at module level for performance optimization
+_COMPILED_PATTERNS = {
+    # Group and neighbor patterns
+    'group_pattern': re.compile(r'group\s+(\S+)\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\}', re.DOTALL),
+    'neighbor_pattern': re.compile(r'neighbor\s+(\S+)\s*\{([^}]*)\}'),
+
+    # Configuration element patterns
+    'type_pattern': re.compile(r'type\s+(\S+);'),
+    'import_pattern': re.compile(r'import\s+\[\s*([^\]]+)\s*\];'),
+    'export_pattern': re.compile(r'export\s+\[\s*([^\]]+)\s*\];'),
+    'policy_pattern': re.compile(r'(import|export)\s+\[\s*([^\]]+)\s*\];'),
+    'peer_as_pattern': re.compile(r'peer-as\s+(\d+);'),
+    'external_as_pattern': re.compile(r'(?:peer-as|external-as)\s+(\d+);'),
+    'description_pattern': re.compile(r'description\s+"([^"]+)";'),
+
+    # AS number extraction patterns
+    'local_as_pattern': re.compile(r'autonomous-system\s+(\d+);'),
+    'local_as_alt_pattern': re.compile(r'local-as\s+(\d+);'),
+    'as_path_prepend_pattern': re.compile(r'as-path-prepend\s+"(\d+(?:\s+\d+)*)"'),
+    'any_single_as_pattern': re.compile(r'(?:peer-as|external-as|local-as|autonomous-system)\s+(\d+);'),
+
+    # Address family patterns
+    'family_inet_pattern': re.compile(r'family\s+inet\s*\{'),
+    'family_inet6_pattern': re.compile(r'family\s+inet6\s*\{'),
+    'ipv6_address_pattern': re.compile(r'[0-9a-fA-F]{1,4}:[0-9a-fA-F]{1,4}')
+}
+
 
 @dataclass
 class BGPNeighbor:
@@ -64,30 +91,8 @@ class BGPConfigParser:
         """Initialize BGPConfigParser."""
         self.logger = logging.getLogger(__name__)
 
-        # Pre-compile all regex patterns for performance optimization
-        self._compiled_patterns = {
-            # Group and neighbor patterns
-            'group_pattern': re.compile(r'group\s+(\S+)\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\}', re.DOTALL),
-            'neighbor_pattern': re.compile(r'neighbor\s+(\S+)\s*\{([^}]*)\}'),
-
-            # Configuration element patterns
-            'type_pattern': re.compile(r'type\s+(\S+);'),
-            'import_pattern': re.compile(r'import\s+\[\s*([^\]]+)\s*\];'),
-            'export_pattern': re.compile(r'export\s+\[\s*([^\]]+)\s*\];'),
-            'peer_as_pattern': re.compile(r'peer-as\s+(\d+);'),
-            'external_as_pattern': re.compile(r'(?:peer-as|external-as)\s+(\d+);'),
-            'description_pattern': re.compile(r'description\s+"([^"]+)";'),
-
-            # AS number extraction patterns
-            'local_as_pattern': re.compile(r'autonomous-system\s+(\d+);'),
-            'local_as_alt_pattern': re.compile(r'local-as\s+(\d+);'),
-            'as_path_prepend_pattern': re.compile(r'as-path-prepend\s+"(\d+(?:\s+\d+)*)"'),
-
-            # Address family patterns
-            'family_inet_pattern': re.compile(r'family\s+inet\s*\{'),
-            'family_inet6_pattern': re.compile(r'family\s+inet6\s*\{'),
-            'ipv6_address_pattern': re.compile(r'[0-9a-fA-F]{1,4}:[0-9a-fA-F]{1,4}')
-        }
+        # Patterns are compiled once at import time and shared by all instances
+        self._compiled_patterns = _COMPILED_PATTERNS
 
     def parse_config(self, config: str) -> Dict:
         """
@@ -182,17 +187,13 @@ class BGPConfigParser:
         if type_match:
             group.type = type_match.group(1)
 
-        # Extract import policies using pre-compiled pattern
-        import_matches = self._compiled_patterns['import_pattern'].findall(content)
-        for match in import_matches:
+        # Extract import and export policies in a single pass, dispatching on direction
+        for direction, match in self._compiled_patterns['policy_pattern'].findall(content):
             policies = [p.strip() for p in match.split()]
-            group.import_policy.extend(policies)
-
-        # Extract export policies using pre-compiled pattern
-        export_matches = self._compiled_patterns['export_pattern'].findall(content)
-        for match in export_matches:
-            policies = [p.strip() for p in match.split()]
-            group.export_policy.extend(policies)
+            if direction == 'import':
+                group.import_policy.extend(policies)
+            else:
+                group.export_policy.extend(policies)
 
         # Parse neighbors
         neighbors = self._parse_neighbors(content, group.name)
@@ -299,20 +300,12 @@ class BGPConfigParser:
         """
         as_numbers = set()
 
-        # Extract AS numbers using pre-compiled patterns
-        # Single AS number patterns
-        single_as_patterns = [
-            self._compiled_patterns['peer_as_pattern'],
-            self._compiled_patterns['external_as_pattern'],
-            self._compiled_patterns['local_as_alt_pattern'],
-            self._compiled_patterns['local_as_pattern']
-        ]
-
-        for pattern in single_as_patterns:
-            for match in pattern.finditer(config):
-                as_num = int(match.group(1))
-                if self._is_valid_as_number(as_num):
-                    as_numbers.add(as_num)
+        # Single AS number statements (peer-as, external-as, local-as,
+        # autonomous-system) are matched with one combined pattern in one pass
+        for match in self._compiled_patterns['any_single_as_pattern'].finditer(config):
+            as_num = int(match.group(1))
+            if self._is_valid_as_number(as_num):
+                as_numbers.add(as_num)
 
         # AS path prepend can have multiple AS numbers
         for match in self._compiled_patterns['as_path_prepend_pattern'].finditer(config):
@@ -339,17 +332,10 @@ class BGPConfigParser:
             "export": []
         }
 
-        # Extract import policies using pre-compiled pattern
-        import_matches = self._compiled_patterns['import_pattern'].findall(config)
-        for match in import_matches:
-            policy_names = [p.strip() for p in match.split()]
-            policies["import"].extend(policy_names)
-
-        # Extract export policies using pre-compiled pattern
-        export_matches = self._compiled_patterns['export_pattern'].findall(config)
-        for match in export_matches:
+        # Extract import and export policies in a single pass over the config
+        for direction, match in self._compiled_patterns['policy_pattern'].findall(config):
             policy_names = [p.strip() for p in match.split()]
-            policies["export"].extend(policy_names)
+            policies[direction].extend(policy_names)
 
         # Remove duplicates while preserving order
         policies["import"] = list(dict.fromkeys(policies["import"]))
@@ -10,14 +10,20 @@ Modern wrapper for bgpq4 with support for:
 """
 
 import fcntl
+import hashlib
+import json
 import logging
+import logging.handlers
 import multiprocessing
 import os
 import re
 import shutil
 import subprocess
+import sys
+import tempfile
 import time
 from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -29,6 +35,9 @@ from otto_bgp.utils.subprocess_manager import ProcessState, run_with_resource_ma
 # Import timeout management
 from otto_bgp.utils.timeout_config import TimeoutType, get_timeout, timeout_context
 
+# CPU count is fixed for the life of the process; read it once for worker sizing
+_CPU_COUNT = multiprocessing.cpu_count()
+
 
 class BGPq4Mode(Enum):
     """BGPq4 execution modes"""
@@ -52,6 +61,7 @@ class PolicyGenerationResult:
     bgpq4_mode: Optional[str] = None
     router_context: Optional[str] = None  # Router association
     resource: Optional[str] = None  # NEW: canonical target id (e.g., "AS13335" or "RS-RACKDOG6079")
+    cache_hit: bool = False  # Served from the policy cache without running bgpq4
 
 
 @dataclass
@@ -145,12 +155,83 @@ class WorkerHealthMonitor:
         }
 
 
+def _worker_mp_context():
+    """
+    Multiprocessing context for bgpq4 worker pools
+
+    On Linux, workers are started from a fork server that has already imported
+    this module, rather than forking the (possibly threaded, large) caller.
+    Other platforms keep the interpreter's default start method.
+    """
+    if not sys.platform.startswith("linux") or "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _init_worker_logging(log_queue, level: int):
+    """
+    Worker initializer: send log records to the parent process
+
+    Fork-server and spawned workers don't inherit the parent's handlers, so
+    records are queued to the parent and emitted there instead.
+    """
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+
+class _WorkerLogListener(logging.handlers.QueueListener):
+    """Emit worker log records through the parent's logger of the same name"""
+
+    def handle(self, record):
+        logging.getLogger(record.name).handle(record)
+
+
+# Wrappers built inside worker processes, keyed by configuration, so that
+# bgpq4 detection runs once per worker instead of once per task
+_worker_wrappers: Dict[Tuple, "BGPq4Wrapper"] = {}
+
+
+def _get_worker_wrapper(wrapper_config: Dict[str, Any]) -> "BGPq4Wrapper":
+    """Return the worker process's BGPq4Wrapper for wrapper_config, creating it on first use"""
+    proxy_tunnels = wrapper_config.get("proxy_tunnels") or {}
+    key = (
+        wrapper_config["mode"],
+        wrapper_config["docker_image"],
+        wrapper_config["command_timeout"],
+        wrapper_config["native_bgpq4_path"],
+        tuple(sorted(proxy_tunnels.items())),
+    )
+
+    wrapper = _worker_wrappers.get(key)
+    if wrapper is None:
+        # Disable cache to avoid file locking issues between processes
+        wrapper = BGPq4Wrapper(
+            mode=wrapper_config["mode"],
+            docker_image=wrapper_config["docker_image"],
+            command_timeout=wrapper_config["command_timeout"],
+            native_bgpq4_path=wrapper_config["native_bgpq4_path"],
+            proxy_manager=None,  # Proxy manager cannot be pickled
+            enable_cache=False,  # Use file-based caching instead
+            proxy_tunnels=proxy_tunnels,
+        )
+        _worker_wrappers.clear()  # Keep only the current configuration
+        _worker_wrappers[key] = wrapper
+
+    return wrapper
+
+
 def _generate_policy_worker(args) -> PolicyGenerationResult:
     """
     Worker function for parallel policy generation with timeout protection
 
     This function is defined at module level to support pickling for ProcessPoolExecutor.
-    It creates a new BGPq4Wrapper instance for each process to ensure process isolation.
+    Each worker process builds its own BGPq4Wrapper and reuses it across tasks.
     Includes comprehensive timeout handling and process health monitoring.
 
     Args:
@@ -171,57 +252,19 @@ def _generate_policy_worker(args) -> PolicyGenerationResult:
         monitor.heartbeat()
 
         try:
-            # Create new wrapper instance for this process
-            # Disable cache to avoid file locking issues between processes
-            wrapper = BGPq4Wrapper(
-                mode=wrapper_config["mode"],
-                docker_image=wrapper_config["docker_image"],
-                command_timeout=wrapper_config["command_timeout"],
-                native_bgpq4_path=wrapper_config["native_bgpq4_path"],
-                proxy_manager=None,  # Proxy manager cannot be pickled
-                enable_cache=False,  # Use file-based caching instead
-                proxy_tunnels=wrapper_config.get("proxy_tunnels") or {},
-            )
+            # Reuse this process's wrapper for the same configuration
+            wrapper = _get_worker_wrapper(wrapper_config)
 
             monitor.heartbeat()
 
-            # Check cache first using DB cache manager
-            from otto_bgp.database.bgpq4_cache import BGPq4CacheManager
-            cache_manager = BGPq4CacheManager()
-
-            cached_policy = cache_manager.get_policy(
-                as_number=as_number,
-                policy_name=policy_name
-            )
-            if cached_policy:
-                return PolicyGenerationResult(
-                    as_number=as_number,
-                    policy_name=policy_name or f"AS{as_number}",
-                    policy_content=cached_policy,
-                    success=True,
-                    execution_time=0.0,
-                    cache_hit=True,
-                    resource=f"AS{as_number}",
-                    bgpq4_mode=wrapper_config["mode"]
-                )
-
-            # Generate policy if not cached
+            # Cache hits are resolved by the parent before dispatch and results
+            # are cached by the parent as they arrive, so workers only run bgpq4
             with timeout_context(TimeoutType.PROCESS_EXECUTION, f"bgpq4_AS{as_number}"):
                 result = wrapper.generate_policy_for_as(as_number, policy_name, use_cache=False)
 
             # Record operation result
             monitor.record_operation(success=result.success)
 
-            # Save to cache if successful
-            if result.success and result.policy_content:
-                cache_manager.put_policy(
-                    policy_content=result.policy_content,
-                    as_number=as_number,
-                    policy_name=policy_name,
-                    resource=result.resource or f"AS{as_number}",
-                    ttl=wrapper_config["cache_ttl"]
-                )
-
             return result
 
         except TimeoutError as e:
@@ -273,10 +316,6 @@ def _save_to_process_safe_cache(as_number: int, policy_content: str, policy_name
         policy_name: Policy name (optional)
         ttl: Time to live in seconds
     """
-    import json
-    import tempfile
-    import time
-
     try:
         # Get cache directory
         cache_dir = Path.home() / ".otto-bgp" / "cache"
@@ -288,8 +327,6 @@ def _save_to_process_safe_cache(as_number: int, policy_content: str, policy_name
         else:
             cache_key = f"policy_AS{as_number}"
 
-        import hashlib
-
         key_hash = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
         cache_file = cache_dir / f"{key_hash}.json"
 
@@ -323,9 +360,6 @@ def _load_from_process_safe_cache(as_number: int, policy_name: str = None) -> Op
     Returns:
         Cached policy content or None if not found/expired
     """
-    import json
-    import time
-
     try:
         # Get cache directory
         cache_dir = Path.home() / ".otto-bgp" / "cache"
@@ -338,8 +372,6 @@ def _load_from_process_safe_cache(as_number: int, policy_name: str = None) -> Op
         else:
             cache_key = f"policy_AS{as_number}"
 
-        import hashlib
-
         key_hash = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
         cache_file = cache_dir / f"{key_hash}.json"
 
@@ -404,6 +436,9 @@ def _load_from_process_safe_cache(as_number: int, policy_name: str = None) -> Op
         return None
 
 
+POLICY_NAME_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
+
+
 def validate_policy_name(policy_name: str) -> str:
     """
     Validate policy name for safe shell command construction
@@ -423,8 +458,9 @@ def validate_policy_name(policy_name: str) -> str:
     if not policy_name:
         raise ValueError("Policy name cannot be empty")
 
-    # Allow only alphanumeric characters, underscores, and hyphens
-    if not re.match(r"^[A-Za-z0-9_-]+$", policy_name):
+    # Allow only alphanumeric characters, underscores, and hyphens. A set check
+    # also rejects a trailing newline, which "$" in a regex would let through
+    if not POLICY_NAME_CHARS.issuperset(policy_name):
         raise ValueError(f"Policy name contains invalid characters (only A-Z, a-z, 0-9, _, - allowed): {policy_name}")
 
     # Reasonable length limit
@@ -463,7 +499,7 @@ def validate_irr_object_name(name: str) -> str:
     """
     if not isinstance(name, str) or not name or len(name) > 128:
         raise ValueError(f"Invalid IRR object name length: {name!r}")
-    if not VALID_IRR_OBJECT.match(name):
+    if not VALID_IRR_OBJECT.fullmatch(name):
         raise ValueError(f"Invalid IRR object characters: {name!r}")
     # Validate known IRR object types (permissive - support multiple registries)
     upper_name = name.upper()
@@ -543,6 +579,11 @@ class BGPq4Wrapper:
         self.detected_mode = None
         self.bgpq4_command = None
 
+        # Worker pool for parallel generation, created on first use and reused
+        self._executor = None
+        self._executor_workers = 0
+        self._log_listener = None
+
         # Initialize and detect available bgpq4
         self._detect_bgpq4_availability()
 
@@ -703,8 +744,6 @@ class BGPq4Wrapper:
         Returns:
             PolicyGenerationResult with policy content and metadata
         """
-        import time
-
         try:
             # Validate inputs early for security and clear error messages
             validated_as = validate_as_number(as_number)
@@ -732,7 +771,7 @@ class BGPq4Wrapper:
             self.logger.info(f"Generating policy for AS{validated_as} (policy: {policy_name})")
 
             command = self._build_bgpq4_command(validated_as, policy_name, irr_server)
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Use custom timeout if provided, otherwise use default
             effective_timeout = timeout if timeout is not None else self.command_timeout
@@ -801,7 +840,7 @@ class BGPq4Wrapper:
                 )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_msg = f"Unexpected error: {str(e)}"
             self.logger.error(f"Unexpected error generating policy for AS{validated_as}: {error_msg}")
 
@@ -936,8 +975,6 @@ class BGPq4Wrapper:
             - Process-safe file caching prevents race conditions
             - Individual process failures don't affect other processes
         """
-        import time
-
         if isinstance(as_numbers, set):
             as_numbers = sorted(as_numbers)
 
@@ -956,7 +993,7 @@ class BGPq4Wrapper:
                 except ValueError:
                     max_workers = None
             if max_workers is None:
-                cpu_count = multiprocessing.cpu_count()
+                cpu_count = _CPU_COUNT
                 max_workers = min(cpu_count, 8, len(as_numbers))
 
         # Apply proxy-aware worker cap if proxy endpoints are present
@@ -972,7 +1009,7 @@ class BGPq4Wrapper:
 
         self.logger.info(f"Starting parallel policy generation for {len(as_numbers)} AS numbers using {max_workers} workers")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = []
 
         # If proxy manager is configured, establish tunnels once and snapshot endpoints
@@ -989,6 +1026,19 @@ class BGPq4Wrapper:
                 self.logger.warning(f"Failed to establish proxy tunnels: {e}")
                 proxy_tunnels = {}
 
+        # One cache manager serves every lookup; hits are answered here so
+        # only cache misses are dispatched to worker processes
+        from otto_bgp.database.bgpq4_cache import BGPq4CacheManager
+        cache_manager = BGPq4CacheManager()
+        wrapper_config = {
+            "mode": self.mode,
+            "docker_image": self.docker_image,
+            "command_timeout": self.command_timeout,
+            "native_bgpq4_path": self.native_bgpq4_path,
+            "cache_ttl": self.cache_ttl if hasattr(self, "cache_ttl") else 3600,
+            "proxy_tunnels": proxy_tunnels,
+        }
+
         # Validate all inputs first for security
         validated_tasks = []
         for as_number in as_numbers:
@@ -1002,9 +1052,6 @@ class BGPq4Wrapper:
                     policy_name = validate_policy_name(policy_name)
 
                 # Check DB cache first
-                from otto_bgp.database.bgpq4_cache import BGPq4CacheManager
-                cache_manager = BGPq4CacheManager()
-
                 cached_policy = cache_manager.get_policy(
                     as_number=validated_as,
                     policy_name=policy_name
@@ -1026,14 +1073,6 @@ class BGPq4Wrapper:
                     )
                 else:
                     # Add to parallel processing queue
-                    wrapper_config = {
-                        "mode": self.mode,
-                        "docker_image": self.docker_image,
-                        "command_timeout": self.command_timeout,
-                        "native_bgpq4_path": self.native_bgpq4_path,
-                        "cache_ttl": self.cache_ttl if hasattr(self, "cache_ttl") else 3600,
-                        "proxy_tunnels": proxy_tunnels,
-                    }
                     validated_tasks.append((validated_as, policy_name, wrapper_config))
 
             except ValueError as e:
@@ -1060,107 +1099,139 @@ class BGPq4Wrapper:
 
             try:
                 with timeout_context(TimeoutType.BATCH_PROCESSING, f"parallel_generation_{len(validated_tasks)}_AS") as ctx:
-                    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                        # Submit all tasks
-                        future_to_as = {executor.submit(_generate_policy_worker, task): task[0] for task in validated_tasks}
-
-                        # Track completed and pending futures
-                        completed_count = 0
-                        pending_futures = set(future_to_as.keys())
-
-                        # Collect results with timeout and health monitoring
-                        while pending_futures and not ctx.check_timeout():
-                            try:
-                                # Use timeout to prevent indefinite blocking
-                                timeout_remaining = min(process_timeout, ctx.remaining_time())
-                                if timeout_remaining <= 0:
-                                    self.logger.warning("Batch timeout reached, cancelling remaining tasks")
-                                    break
-
-                                # Wait for at least one future to complete
-                                for future in as_completed(pending_futures, timeout=timeout_remaining):
-                                    as_number = future_to_as[future]
-                                    pending_futures.discard(future)
-
-                                    try:
-                                        # Get result with individual process timeout
-                                        result = future.result(timeout=process_timeout)
-                                        results.append(result)
-                                        completed_count += 1
-
-                                        # Log progress
-                                        if result.success:
-                                            self.logger.debug(
-                                                f"Completed AS{as_number} in {result.execution_time:.2f}s "
-                                                f"({completed_count}/{len(validated_tasks)})"
-                                            )
-                                        else:
-                                            self.logger.warning(f"Failed AS{as_number}: {result.error_message}")
-
-                                    except FuturesTimeoutError:
-                                        # Individual process timeout
-                                        self.logger.error(f"Process timeout for AS{as_number} after {process_timeout}s")
-                                        results.append(
-                                            PolicyGenerationResult(
-                                                as_number=as_number,
-                                                policy_name=f"AS{as_number}",
-                                                policy_content="",
-                                                success=False,
-                                                execution_time=process_timeout,
-                                                error_message=f"Process timeout after {process_timeout}s",
-                                                bgpq4_mode=self.detected_mode.value if self.detected_mode else "unknown",
-                                            )
+                    # Reuse the wrapper's worker pool across batch calls
+                    executor = self._get_executor(max_workers)
+                    # Submit all tasks
+                    future_to_as = {executor.submit(_generate_policy_worker, task): task[0] for task in validated_tasks}
+                    task_policy_names = {task[0]: task[1] for task in validated_tasks}
+
+                    # Track completed and pending futures
+                    completed_count = 0
+                    pending_futures = set(future_to_as.keys())
+
+                    # Collect results with timeout and health monitoring
+                    while pending_futures and not ctx.check_timeout():
+                        try:
+                            # Use timeout to prevent indefinite blocking
+                            timeout_remaining = min(process_timeout, ctx.remaining_time())
+                            if timeout_remaining <= 0:
+                                self.logger.warning("Batch timeout reached, cancelling remaining tasks")
+                                break
+
+                            # Wait for at least one future to complete
+                            for future in as_completed(pending_futures, timeout=timeout_remaining):
+                                as_number = future_to_as[future]
+                                pending_futures.discard(future)
+
+                                try:
+                                    # Get result with individual process timeout
+                                    result = future.result(timeout=process_timeout)
+                                    results.append(result)
+                                    completed_count += 1
+
+                                    # Cache writes happen here, one at a time, while
+                                    # the remaining workers keep running bgpq4
+                                    if result.success and result.policy_content:
+                                        cache_manager.put_policy(
+                                            policy_content=result.policy_content,
+                                            as_number=as_number,
+                                            policy_name=task_policy_names[as_number],
+                                            resource=result.resource or f"AS{as_number}",
+                                            ttl=wrapper_config["cache_ttl"],
                                         )
-                                        # Cancel the timed-out future
-                                        future.cancel()
-
-                                    except Exception as e:
-                                        # Handle other process execution errors
-                                        self.logger.error(f"Process error for AS{as_number}: {e}")
-                                        results.append(
-                                            PolicyGenerationResult(
-                                                as_number=as_number,
-                                                policy_name=f"AS{as_number}",
-                                                policy_content="",
-                                                success=False,
-                                                execution_time=0.0,
-                                                error_message=f"Process execution error: {str(e)}",
-                                                bgpq4_mode=self.detected_mode.value if self.detected_mode else "unknown",
-                                            )
+
+                                    # Log progress
+                                    if result.success:
+                                        self.logger.debug(
+                                            f"Completed AS{as_number} in {result.execution_time:.2f}s "
+                                            f"({completed_count}/{len(validated_tasks)})"
+                                        )
+                                    else:
+                                        self.logger.warning(f"Failed AS{as_number}: {result.error_message}")
+
+                                except FuturesTimeoutError:
+                                    # Individual process timeout
+                                    self.logger.error(f"Process timeout for AS{as_number} after {process_timeout}s")
+                                    results.append(
+                                        PolicyGenerationResult(
+                                            as_number=as_number,
+                                            policy_name=f"AS{as_number}",
+                                            policy_content="",
+                                            success=False,
+                                            execution_time=process_timeout,
+                                            error_message=f"Process timeout after {process_timeout}s",
+                                            bgpq4_mode=self.detected_mode.value if self.detected_mode else "unknown",
                                         )
+                                    )
+                                    # Cancel the timed-out future
+                                    future.cancel()
+
+                                except BrokenProcessPool as e:
+                                    # A worker died; drop the dead pool so the next batch gets a fresh one
+                                    self.logger.error(f"Worker pool broken while processing AS{as_number}: {e}")
+                                    self._shutdown_executor(wait=False)
+                                    results.append(
+                                        PolicyGenerationResult(
+                                            as_number=as_number,
+                                            policy_name=f"AS{as_number}",
+                                            policy_content="",
+                                            success=False,
+                                            execution_time=0.0,
+                                            error_message=f"Worker pool broken: {str(e)}",
+                                            bgpq4_mode=self.detected_mode.value if self.detected_mode else "unknown",
+                                        )
+                                    )
 
-                                    # Break from inner loop to check timeout
-                                    break
-
-                            except FuturesTimeoutError:
-                                # No futures completed within timeout - check if we should continue
-                                if ctx.check_timeout():
-                                    self.logger.warning("Batch timeout reached while waiting for completions")
-                                    break
-                                # Continue waiting if batch timeout not reached
-                                continue
-
-                        # Handle any remaining pending futures
-                        if pending_futures:
-                            self.logger.warning(f"Cancelling {len(pending_futures)} pending tasks due to timeout")
-                            for future in pending_futures:
-                                future.cancel()
-                                as_number = future_to_as[future]
-                                results.append(
-                                    PolicyGenerationResult(
-                                        as_number=as_number,
-                                        policy_name=f"AS{as_number}",
-                                        policy_content="",
-                                        success=False,
-                                        execution_time=0.0,
-                                        error_message="Task cancelled due to batch timeout",
-                                        bgpq4_mode=self.detected_mode.value if self.detected_mode else "unknown",
+                                except Exception as e:
+                                    # Handle other process execution errors
+                                    self.logger.error(f"Process error for AS{as_number}: {e}")
+                                    results.append(
+                                        PolicyGenerationResult(
+                                            as_number=as_number,
+                                            policy_name=f"AS{as_number}",
+                                            policy_content="",
+                                            success=False,
+                                            execution_time=0.0,
+                                            error_message=f"Process execution error: {str(e)}",
+                                            bgpq4_mode=self.detected_mode.value if self.detected_mode else "unknown",
+                                        )
                                     )
+
+                                # Break from inner loop to check timeout
+                                break
+
+                        except FuturesTimeoutError:
+                            # No futures completed within timeout - check if we should continue
+                            if ctx.check_timeout():
+                                self.logger.warning("Batch timeout reached while waiting for completions")
+                                break
+                            # Continue waiting if batch timeout not reached
+                            continue
+
+                    # Handle any remaining pending futures
+                    if pending_futures:
+                        self.logger.warning(f"Cancelling {len(pending_futures)} pending tasks due to timeout")
+                        for future in pending_futures:
+                            future.cancel()
+                            as_number = future_to_as[future]
+                            results.append(
+                                PolicyGenerationResult(
+                                    as_number=as_number,
+                                    policy_name=f"AS{as_number}",
+                                    policy_content="",
+                                    success=False,
+                                    execution_time=0.0,
+                                    error_message="Task cancelled due to batch timeout",
+                                    bgpq4_mode=self.detected_mode.value if self.detected_mode else "unknown",
                                 )
+                            )
+                        # Workers may still be running timed-out bgpq4 calls; don't reuse them
+                        self._shutdown_executor(wait=False)
 
             except Exception as e:
                 # Handle ProcessPoolExecutor initialization errors
                 self.logger.error(f"Failed to initialize parallel processing: {e}")
+                self._shutdown_executor(wait=False)
                 # Fallback to sequential processing for remaining tasks
                 self.logger.info("Falling back to sequential processing")
 
@@ -1187,7 +1258,7 @@ class BGPq4Wrapper:
                             )
                         )
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         successful_count = sum(1 for r in results if r.success)
         failed_count = len(results) - successful_count
 
@@ -1215,6 +1286,54 @@ class BGPq4Wrapper:
 
         return batch_result
 
+    def _get_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        """
+        Return the wrapper's worker pool, creating it on first use
+
+        Worker processes are kept alive between batches so repeated calls
+        don't pay process startup again. The pool is rebuilt when a batch
+        asks for a different worker count. Worker log records are forwarded
+        to this process's handlers while the pool is alive.
+        """
+        if self._executor is not None and self._executor_workers != max_workers:
+            self._shutdown_executor()
+
+        if self._executor is None:
+            context = _worker_mp_context()
+            log_queue = (context or multiprocessing).Queue()
+            self._log_listener = _WorkerLogListener(log_queue)
+            self._log_listener.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=context,
+                initializer=_init_worker_logging,
+                initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+            )
+            self._executor_workers = max_workers
+
+        return self._executor
+
+    def _shutdown_executor(self, wait: bool = True):
+        """Shut down the worker pool and its log listener, if running"""
+        executor, self._executor = self._executor, None
+        listener, self._log_listener = self._log_listener, None
+        self._executor_workers = 0
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        if listener is not None:
+            listener.stop()
+
+    def close(self):
+        """Release worker processes held for parallel generation"""
+        self._shutdown_executor()
+
+    def __del__(self):
+        """Destructor cleanup as last resort"""
+        try:
+            self._shutdown_executor(wait=False)
+        except Exception:
+            pass  # Silent cleanup in destructor
+
     def generate_policies_batch(
         self,
         as_numbers: Union[List[int], Set[int]],
@@ -1239,8 +1358,6 @@ class BGPq4Wrapper:
         Returns:
             PolicyBatchResult with all policy generation results
         """
-        import time
-
         if isinstance(as_numbers, set):
             as_numbers = sorted(as_numbers)
 
@@ -1270,7 +1387,7 @@ class BGPq4Wrapper:
         # Fall back to sequential processing
         self.logger.info(f"Starting sequential policy generation for {len(as_numbers)} AS numbers")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = []
 
         for as_number in as_numbers:
@@ -1278,7 +1395,7 @@ class BGPq4Wrapper:
             result = self.generate_policy_for_as(as_number, policy_name)
             results.append(result)
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         successful_count = sum(1 for r in results if r.success)
         failed_count = len(results) - successful_count
 
@@ -1427,7 +1544,7 @@ class BGPq4Wrapper:
 
         # Add parallel processing configuration (standardized)
         max_workers_env = os.getenv("OTTO_BGP_BGPQ4_MAX_WORKERS", "auto")
-        cpu_count = multiprocessing.cpu_count()
+        cpu_count = _CPU_COUNT
         try:
             mw = int(max_workers_env)
             parallel_state = "disabled" if mw <= 1 else "enabled"
@@ -1476,7 +1593,7 @@ class BGPq4Wrapper:
                 pass
 
         # Auto-calculate based on system resources and workload
-        cpu_count = multiprocessing.cpu_count()
+        cpu_count = _CPU_COUNT
 
         # For small workloads, limit workers to workload size
         if as_count <= 2:
@@ -11,6 +11,7 @@ import gc
 import heapq
 import logging
 import os
+import re
 import tempfile
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -18,6 +19,20 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, TextIO
 
+# Number of prefix lines accumulated before a single batched write in streaming mode
+STREAM_WRITE_CHUNK_LINES = 65536
+
+# Write buffer for streaming output so large combined files flush in ~1MB syscalls
+STREAM_WRITE_BUFFER_BYTES = 1024 * 1024
+
+# Rough peak-memory multiple of input size for standard (in-memory) combination
+STANDARD_MODE_MEMORY_FACTOR = 5
+
+# Patterns are compiled once at import time rather than on every policy file or output line
+_PREFIX_PATTERN = re.compile(r"(\d+\.\d+\.\d+\.\d+/\d+)")
+_PREFIX_LIST_PATTERN = re.compile(r"prefix-list\s+(\S+)\s*{([^}]*)}", re.DOTALL)
+_AS_FILENAME_PATTERN = re.compile(r"AS(\d+)")
+
 
 @dataclass
 class CombinedPolicyResult:
@@ -348,8 +363,11 @@ class PolicyCombiner:
         """Estimate total file size in MB"""
         total_size = 0
         for policy_file in policy_files:
-            if policy_file.exists():
+            # One stat per file; missing files are skipped rather than probed first
+            try:
                 total_size += policy_file.stat().st_size
+            except OSError:
+                continue
         return total_size / (1024 * 1024)
 
     def _should_use_streaming(self, policy_files: List[Path]) -> bool:
@@ -362,6 +380,18 @@ class PolicyCombiner:
         total_size_mb = self._estimate_total_file_size_mb(policy_files)
         use_streaming = total_size_mb > self.streaming_threshold_mb
 
+        # Standard mode holds every file plus the combined output in memory; switch
+        # to streaming up front when that estimate would exceed the memory budget
+        if not use_streaming:
+            available_mb = self._get_available_memory_mb()
+            estimated_mb = total_size_mb * STANDARD_MODE_MEMORY_FACTOR
+            if available_mb is not None and estimated_mb > available_mb * 0.5:
+                self.logger.warning(
+                    f"Standard mode would need ~{estimated_mb:.1f}MB with {available_mb:.1f}MB available, "
+                    "using streaming mode"
+                )
+                use_streaming = True
+
         if use_streaming:
             self.logger.info(f"Auto-enabling streaming mode for {total_size_mb:.1f}MB of policy files")
         else:
@@ -429,7 +459,7 @@ class PolicyCombiner:
             self.logger.info(f"Using streaming mode for {len(policy_files)} policy files")
 
             # Direct streaming approach - write output immediately without accumulating
-            with open(output_file, "w") as output:
+            with open(output_file, "w", buffering=STREAM_WRITE_BUFFER_BYTES) as output:
                 # Write header
                 timestamp = datetime.now().isoformat()
                 output.write(f"/* Combined BGP policies for {router_hostname} */\n")
@@ -469,11 +499,10 @@ class PolicyCombiner:
                 output.write("}\n")
 
             # Count total prefixes by scanning the output file
-            import re
-
+            prefix_search = _PREFIX_PATTERN.search
             with open(output_file, "r") as f:
                 for line in f:
-                    if "/" in line and re.search(r"\d+\.\d+\.\d+\.\d+/\d+", line):
+                    if "/" in line and prefix_search(line):
                         total_prefixes += 1
 
             end_memory = self._get_memory_usage_mb()
@@ -506,13 +535,23 @@ class PolicyCombiner:
         # Use a set to deduplicate prefixes for this AS only (memory efficient)
         prefixes_seen = set()
 
+        # Buffer output lines and emit them with one join per chunk instead of
+        # one write call per prefix, keeping transient memory bounded
+        pending = []
+
         # Stream through the file line by line
         with open(policy_file, "r") as input_file:
             for line in input_file:
                 prefix = self._extract_prefix_from_line(line)
                 if prefix and prefix not in prefixes_seen:
                     prefixes_seen.add(prefix)
-                    output_file.write(f"        {prefix};\n")
+                    pending.append(f"        {prefix};\n")
+                    if len(pending) >= STREAM_WRITE_CHUNK_LINES:
+                        output_file.write("".join(pending))
+                        pending.clear()
+
+        if pending:
+            output_file.write("".join(pending))
 
         output_file.write("    }\n")
         output_file.write("\n")
@@ -592,12 +631,34 @@ class PolicyCombiner:
 
             return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # On macOS, ru_maxrss is in bytes
 
+    def _get_available_memory_mb(self) -> Optional[float]:
+        """Get available system memory in MB, or None if it cannot be determined"""
+        try:
+            import psutil
+
+            return psutil.virtual_memory().available / (1024 * 1024)
+        except ImportError:
+            pass
+
+        # Linux: MemAvailable counts reclaimable page cache, matching psutil's figure
+        try:
+            with open("/proc/meminfo", "r") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) / 1024  # Reported in kB
+        except (OSError, ValueError, IndexError):
+            pass
+
+        # Fallback to free physical pages (POSIX only, excludes reclaimable cache)
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+        except (AttributeError, ValueError, OSError):
+            return None
+
     def _extract_prefix_from_line(self, line: str) -> Optional[str]:
         """Extract a prefix from a policy line"""
-        import re
-
         # Match IP prefix patterns (IPv4/CIDR)
-        match = re.search(r"(\d+\.\d+\.\d+\.\d+/\d+)", line.strip())
+        match = _PREFIX_PATTERN.search(line.strip())
         if match:
             return match.group(1)
         return None
@@ -898,10 +959,8 @@ class PolicyCombiner:
         Returns:
             Dictionary with prefix-list name and prefixes
         """
-        import re
-
         # Find prefix-list block
-        list_match = re.search(r"prefix-list\s+(\S+)\s*{([^}]*)}", policy_content, re.DOTALL)
+        list_match = _PREFIX_LIST_PATTERN.search(policy_content)
         if not list_match:
             return None
 
@@ -909,7 +968,7 @@ class PolicyCombiner:
         list_content = list_match.group(2)
 
         # Extract prefixes
-        prefixes = re.findall(r"(\d+\.\d+\.\d+\.\d+/\d+)", list_content)
+        prefixes = _PREFIX_PATTERN.findall(list_content)
 
         return {"name": list_name, "prefixes": prefixes}
 
@@ -923,9 +982,7 @@ class PolicyCombiner:
         Returns:
             AS number or 0 if not found
         """
-        import re
-
-        match = re.search(r"AS(\d+)", filename)
+        match = _AS_FILENAME_PATTERN.search(filename)
         if match:
             return int(match.group(1))
         return 0
@@ -940,17 +997,15 @@ class PolicyCombiner:
         Returns:
             List of set commands
         """
-        import re
-
         commands = []
 
         # Extract prefix-list entries
-        list_match = re.search(r"prefix-list\s+(\S+)\s*{([^}]*)}", policy_content, re.DOTALL)
+        list_match = _PREFIX_LIST_PATTERN.search(policy_content)
         if list_match:
             list_name = list_match.group(1)
             list_content = list_match.group(2)
 
-            prefixes = re.findall(r"(\d+\.\d+\.\d+\.\d+/\d+)", list_content)
+            prefixes = _PREFIX_PATTERN.findall(list_content)
             for prefix in prefixes:
                 commands.append(f"set policy-options prefix-list {list_name} {prefix}")
 
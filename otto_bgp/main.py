@@ -271,15 +271,17 @@ def cmd_policy(args):
     if bgpq4_timeout is None:
         bgpq4_timeout = 30
 
-    bgpq4 = BGPq4Wrapper(
-        mode=mode,
-        command_timeout=bgpq4_timeout,
-        proxy_manager=proxy_manager,
-        irr_source=bgpq4_irr_source,
-        aggregate_prefixes=bgpq4_aggregate,
-        ipv4_enabled=bgpq4_ipv4,
-        ipv6_enabled=bgpq4_ipv6,
-    )
+    # The wrapper owns a persistent worker pool, so each use below is
+    # constructed inside the block that closes it
+    bgpq4_options = {
+        "mode": mode,
+        "command_timeout": bgpq4_timeout,
+        "proxy_manager": proxy_manager,
+        "irr_source": bgpq4_irr_source,
+        "aggregate_prefixes": bgpq4_aggregate,
+        "ipv4_enabled": bgpq4_ipv4,
+        "ipv6_enabled": bgpq4_ipv6,
+    }
 
     # Test connection if requested
     if getattr(args, "test", False):
@@ -288,7 +290,11 @@ def cmd_policy(args):
         validator = ParameterValidator()
         test_as = validator.validate_as_number(test_as, "test_as")
 
-        success = bgpq4.test_bgpq4_connection(test_as)
+        bgpq4 = BGPq4Wrapper(**bgpq4_options)
+        try:
+            success = bgpq4.test_bgpq4_connection(test_as)
+        finally:
+            bgpq4.close()
         if success:
             print_success("bgpq4 connectivity test: PASSED")
         else:
@@ -362,6 +368,7 @@ def cmd_policy(args):
             logger.warning(f"RPKI validation failed: {e} - continuing without validation")
 
     # Generate policies
+    bgpq4 = BGPq4Wrapper(**bgpq4_options)
     try:
         # Generate for AS numbers
         if as_list:
@@ -423,6 +430,8 @@ def cmd_policy(args):
 
         return 0 if batch_result.successful_count > 0 else 1
     finally:
+        # Release the persistent bgpq4 worker pool before tearing down tunnels
+        bgpq4.close()
         try:
             if proxy_manager:
                 proxy_manager.cleanup_all_tunnels()
@@ -286,6 +286,8 @@ class BGPPolicyPipeline:
             errors.append(f"Direct-file pipeline failed: {str(e)}")
             self.logger.error(f"Direct-file pipeline failed: {str(e)}", exc_info=True)
             return self._create_error_result(errors)
+        finally:
+            self.bgp_generator.close()
 
     def _collect_bgp_data(self) -> str:
         """
@@ -899,8 +901,9 @@ def run_pipeline(
     Returns:
         Pipeline execution results
     """
-    # Setup logging
-    setup_logging()
+    # Setup logging once; keep handlers an entry point has already configured
+    if not logging.getLogger().handlers:
+        setup_logging()
     logger = logging.getLogger(__name__)
 
     # Create pipeline configuration
@@ -16,6 +16,7 @@ Features:
 import logging
 import os
 import re
+import sys
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -308,6 +309,9 @@ class StreamingASExtractor:
         self.dedup_frequency = dedup_frequency
         self.logger = logging.getLogger(__name__)
 
+        # The minimal-memory extractor holds no per-file state, so one instance serves every call
+        self._ultra_extractor = UltraMemoryEfficientASExtractor(memory_limit_mb=5)
+
     def extract_as_numbers_streaming(
         self, file_path: Union[str, Path], pattern: re.Pattern, validator_func
     ) -> Set[int]:
@@ -365,8 +369,7 @@ class StreamingASExtractor:
         self, file_path: Union[str, Path], pattern: re.Pattern, validator_func
     ) -> Set[int]:
         """Extract AS numbers using ultra-efficient minimal memory approach"""
-        ultra_extractor = UltraMemoryEfficientASExtractor(memory_limit_mb=5)
-        return ultra_extractor.extract_as_numbers_minimal_memory(
+        return self._ultra_extractor.extract_as_numbers_minimal_memory(
             file_path, pattern, validator_func
         )
 
@@ -464,6 +467,9 @@ class ASNumberExtractor:
     AS_NUMBER_MIN = 0
     AS_NUMBER_MAX = 4294967295  # 32-bit unsigned integer maximum
 
+    # Maximum validator verdicts remembered during one streaming extraction
+    VALIDATOR_MEMO_MAX_ENTRIES = 65536
+
     def __init__(
         self,
         min_as_number: int = 256,
@@ -563,16 +569,16 @@ class ASNumberExtractor:
             f"Extracting AS numbers using pattern '{pattern_name}': {pattern}"
         )
 
-        # Optimize by processing entire text at once, then split for line counting
+        # Optimize by processing entire text at once, then count lines for reporting
         compiled_pattern = self._compiled_patterns[pattern_name]
         all_matches = compiled_pattern.findall(text)
 
-        # Count lines for reporting
-        lines = text.split("\n")
-        lines_processed = len(lines)
+        # Count lines for reporting without materializing a list of lines
+        lines_processed = text.count("\n") + 1
 
-        # Process all matches efficiently
-        for match in all_matches:
+        # Repeated tokens are parsed and validated once; dict.fromkeys keeps
+        # first-seen order so log output stays deterministic
+        for match in dict.fromkeys(all_matches):
             try:
                 as_num = int(match)
 
@@ -723,21 +729,43 @@ class ASNumberExtractor:
 
     def _create_validator_function(self):
         """Create a validator function for streaming extraction"""
+        if not self.strict_validation:
 
-        def validator(as_num: int) -> bool:
-            if self.strict_validation:
-                validation_result = self._validate_as_number_strict(as_num)
-                return validation_result["valid"]
-            else:
+            def range_validator(as_num: int) -> bool:
                 return self.min_as_number <= as_num <= self.max_as_number
 
+            return range_validator
+
+        # Strict verdicts are remembered per extraction so repeated AS numbers
+        # skip revalidation; the memo is capped to respect streaming memory limits
+        verdicts: Dict[int, bool] = {}
+
+        def validator(as_num: int) -> bool:
+            valid = verdicts.get(as_num)
+            if valid is not None:
+                return valid
+
+            valid = self._validate_as_number_strict(as_num)["valid"]
+            if len(verdicts) < self.VALIDATOR_MEMO_MAX_ENTRIES:
+                verdicts[as_num] = valid
+            return valid
+
         return validator
 
     def _count_file_lines(self, file_path: Path) -> int:
         """Count lines in file efficiently for reporting"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return sum(1 for _ in f)
+            # Count newlines in raw binary chunks; no decoding or per-line objects
+            line_count = 0
+            last_chunk = b""
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    line_count += chunk.count(b"\n")
+                    last_chunk = chunk
+            # A final line without a trailing newline still counts
+            if last_chunk and not last_chunk.endswith(b"\n"):
+                line_count += 1
+            return line_count
         except Exception:
             return 0
 
@@ -913,8 +941,6 @@ class BGPTextProcessor:
             return result
         else:
             # Use regex for larger operations
-            import re
-
             # Escape special regex characters in substrings
             escaped_substrings = [re.escape(sub) for sub in substrings]
 
@@ -1232,12 +1258,12 @@ class MemoryBenchmark:
         except ImportError:
             self.psutil = None
             self.memory_monitoring_available = False
-            self.logger.warning("psutil not available, memory monitoring disabled")
+            self.logger.warning("psutil not available, reporting peak RSS from getrusage only")
 
     def get_memory_usage(self) -> Dict[str, float]:
         """Get current memory usage in MB"""
         if not self.memory_monitoring_available:
-            return {"rss": 0, "vms": 0, "percent": 0}
+            return self._get_peak_rss_fallback()
 
         try:
             process = self.psutil.Process()
@@ -1253,6 +1279,22 @@ class MemoryBenchmark:
             self.logger.warning(f"Error getting memory usage: {e}")
             return {"rss": 0, "vms": 0, "percent": 0}
 
+    def _get_peak_rss_fallback(self) -> Dict[str, float]:
+        """Get peak RSS in MB via getrusage when psutil is unavailable
+
+        ru_maxrss is a high-water mark, not the current RSS, so it is reported
+        under "peak_rss" and "rss" stays 0 rather than mixing the two meanings.
+        """
+        try:
+            import resource
+        except ImportError:
+            return {"rss": 0, "vms": 0, "percent": 0}
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return {"rss": 0, "vms": 0, "percent": 0, "peak_rss": max_rss / divisor}
+
     def generate_test_file(
         self, output_path: Union[str, Path], size_mb: int = 10, as_density: int = 100
     ) -> Path:
@@ -7,14 +7,24 @@ Provides intelligent caching for policy generation and discovery results.
 import hashlib
 import json
 import logging
+import os
 import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_json_files(directory: Path) -> Iterator[str]:
+    """Yield paths of *.json files in directory using a single scandir pass"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                yield entry.path
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with metadata"""
@@ -38,6 +48,10 @@ class CacheEntry:
 class PolicyCache:
     """Cache for BGP policy generation results"""
 
+    # Upper bound on entries held in memory; older entries stay on disk and
+    # are reloaded on demand
+    MEMORY_CACHE_MAX_ENTRIES = 512
+
     def __init__(self, cache_dir: Union[str, Path] = None, default_ttl: int = 3600):
         """
         Initialize policy cache
@@ -54,8 +68,8 @@ class PolicyCache:
         self.default_ttl = default_ttl
         self.logger = logging.getLogger(self.__class__.__name__)
 
-        # In-memory cache for performance
-        self._memory_cache: Dict[str, CacheEntry] = {}
+        # Bounded in-memory cache in least-recently-used order
+        self._memory_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
 
         # Load existing cache from disk
         self._load_disk_cache()
@@ -80,10 +94,16 @@ class PolicyCache:
         """
         cache_key = self._generate_policy_key(as_number, policy_name, resource)
 
-        # Check memory cache first
-        if cache_key in self._memory_cache:
-            entry = self._memory_cache[cache_key]
+        # Check memory cache first, falling back to the entry on disk
+        entry = self._memory_cache.get(cache_key)
+        if entry is None:
+            entry = self._load_disk_entry(cache_key)
+            if entry is not None:
+                self._remember(cache_key, entry)
+
+        if entry is not None:
             if not entry.is_expired:
+                self._memory_cache.move_to_end(cache_key)
                 resource_id = resource or f"AS{as_number}" if as_number else "unknown"
                 self.logger.debug(
                     f"Policy cache hit for {resource_id} (age: {entry.age_seconds}s)"
@@ -131,7 +151,7 @@ class PolicyCache:
         )
 
         # Store in memory
-        self._memory_cache[cache_key] = entry
+        self._remember(cache_key, entry)
 
         # Store on disk
         self._save_disk_entry(cache_key, entry)
@@ -173,20 +193,24 @@ class PolicyCache:
         Returns:
             Number of entries removed
         """
-        removed = 0
-        expired_keys = []
+        expired_keys = set()
 
-        # Find expired entries
+        # Entries evicted from memory still live on disk, so walk the directory
+        for _, cache_key, entry in self._iter_disk_entries():
+            if entry.is_expired:
+                expired_keys.add(cache_key)
+
+        # Entries whose disk write failed exist only in memory
         for key, entry in self._memory_cache.items():
             if entry.is_expired:
-                expired_keys.append(key)
+                expired_keys.add(key)
 
         # Remove expired entries
         for key in expired_keys:
-            del self._memory_cache[key]
+            self._memory_cache.pop(key, None)
             self._remove_disk_entry(key)
-            removed += 1
 
+        removed = len(expired_keys)
         if removed > 0:
             self.logger.info(f"Removed {removed} expired cache entries")
 
@@ -199,15 +223,20 @@ class PolicyCache:
         Returns:
             Dictionary with cache statistics
         """
-        total_entries = len(self._memory_cache)
-        expired_entries = sum(
-            1 for entry in self._memory_cache.values() if entry.is_expired
-        )
+        expired_by_key = {
+            cache_key: entry.is_expired for _, cache_key, entry in self._iter_disk_entries()
+        }
+        for key, entry in self._memory_cache.items():
+            expired_by_key.setdefault(key, entry.is_expired)
+
+        total_entries = len(expired_by_key)
+        expired_entries = sum(expired_by_key.values())
 
         return {
             "total_entries": total_entries,
             "active_entries": total_entries - expired_entries,
             "expired_entries": expired_entries,
+            "memory_entries": len(self._memory_cache),
             "cache_dir": str(self.cache_dir),
             "default_ttl": self.default_ttl,
         }
@@ -228,6 +257,13 @@ class PolicyCache:
             raise ValueError("Either resource or as_number must be provided")
         return f"policy_{base}_{policy_name}" if policy_name else f"policy_{base}"
 
+    def _remember(self, cache_key: str, entry: CacheEntry) -> None:
+        """Add entry to the memory cache, evicting least recently used entries"""
+        self._memory_cache[cache_key] = entry
+        self._memory_cache.move_to_end(cache_key)
+        while len(self._memory_cache) > self.MEMORY_CACHE_MAX_ENTRIES:
+            self._memory_cache.popitem(last=False)
+
     def _hash_key(self, key: str) -> str:
         """Generate hash for cache key"""
         return hashlib.sha256(key.encode()).hexdigest()[:16]
@@ -246,6 +282,47 @@ class PolicyCache:
         except Exception as e:
             self.logger.warning(f"Failed to save cache entry to disk: {e}")
 
+    def _read_disk_file(self, cache_file: Union[str, Path]) -> Tuple[str, CacheEntry]:
+        """Parse a cache file into its cache key and entry"""
+        with open(cache_file, "r") as f:
+            data = json.load(f)
+        entry_data = data["entry"]
+        entry = CacheEntry(
+            data=entry_data["data"],
+            timestamp=entry_data["timestamp"],
+            ttl_seconds=entry_data["ttl_seconds"],
+            key_hash=entry_data["key_hash"],
+        )
+        return data["cache_key"], entry
+
+    def _iter_disk_entries(self) -> Iterator[Tuple[str, str, CacheEntry]]:
+        """Yield (path, cache key, entry) for every readable cache file on disk"""
+        if not self.cache_dir.exists():
+            return
+        for cache_file in _iter_json_files(self.cache_dir):
+            try:
+                cache_key, entry = self._read_disk_file(cache_file)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self.logger.warning(f"Failed to load cache file {cache_file}: {e}")
+                continue
+            yield cache_file, cache_key, entry
+
+    def _load_disk_entry(self, cache_key: str) -> Optional[CacheEntry]:
+        """Load a single cache entry from disk, if present"""
+        disk_path = self._get_disk_path(cache_key)
+        try:
+            stored_key, entry = self._read_disk_file(disk_path)
+            if stored_key != cache_key:
+                return None
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Failed to load cache file {disk_path}: {e}")
+            return None
+
     def _remove_disk_entry(self, cache_key: str) -> None:
         """Remove cache entry from disk"""
         try:
@@ -261,34 +338,27 @@ class PolicyCache:
             return
 
         loaded = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
+        for cache_file in _iter_json_files(self.cache_dir):
+            # Past the memory bound, remaining entries are served from disk on demand
+            if loaded >= self.MEMORY_CACHE_MAX_ENTRIES:
+                break
 
-                cache_key = data["cache_key"]
-                entry_data = data["entry"]
-
-                entry = CacheEntry(
-                    data=entry_data["data"],
-                    timestamp=entry_data["timestamp"],
-                    ttl_seconds=entry_data["ttl_seconds"],
-                    key_hash=entry_data["key_hash"],
-                )
+            try:
+                cache_key, entry = self._read_disk_file(cache_file)
 
                 # Only load if not expired
                 if not entry.is_expired:
-                    self._memory_cache[cache_key] = entry
+                    self._remember(cache_key, entry)
                     loaded += 1
                 else:
                     # Remove expired file
-                    cache_file.unlink()
+                    os.unlink(cache_file)
 
             except Exception as e:
                 self.logger.warning(f"Failed to load cache file {cache_file}: {e}")
                 # Remove corrupted file
                 try:
-                    cache_file.unlink()
+                    os.unlink(cache_file)
                 except (OSError, PermissionError):
                     pass
 
@@ -400,19 +470,19 @@ class DiscoveryCache:
         removed = 0
         current_time = time.time()
 
-        for cache_file in self.cache_dir.glob("*.json"):
+        for cache_file in _iter_json_files(self.cache_dir):
             try:
                 with open(cache_file, "r") as f:
                     data = json.load(f)
 
                 age = current_time - data["timestamp"]
                 if age > data["ttl_seconds"]:
-                    cache_file.unlink()
+                    os.unlink(cache_file)
                     removed += 1
 
             except Exception:
                 # Remove corrupted files
-                cache_file.unlink()
+                os.unlink(cache_file)
                 removed += 1
 
         if removed > 0:
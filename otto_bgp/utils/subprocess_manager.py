@@ -97,7 +97,7 @@ class ManagedProcess:
     def __enter__(self) -> "ManagedProcess":
         """Start the process and register it for cleanup"""
         try:
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
 
             # Configure subprocess options
             kwargs = {"cwd": self.cwd, "env": self.env, "text": self.text}
@@ -153,7 +153,7 @@ class ManagedProcess:
             else:
                 stdout, stderr = self.process.communicate(input=self.input_data)
 
-            execution_time = time.time() - self.start_time if self.start_time else 0.0
+            execution_time = time.perf_counter() - self.start_time if self.start_time else 0.0
 
             # Determine state based on exit code
             if self.process.returncode == 0:
@@ -172,7 +172,7 @@ class ManagedProcess:
             )
 
         except subprocess.TimeoutExpired:
-            execution_time = time.time() - self.start_time if self.start_time else 0.0
+            execution_time = time.perf_counter() - self.start_time if self.start_time else 0.0
 
             # Handle timeout with graceful termination
             self.logger.warning(
@@ -201,7 +201,7 @@ class ManagedProcess:
             )
 
         except Exception as e:
-            execution_time = time.time() - self.start_time if self.start_time else 0.0
+            execution_time = time.perf_counter() - self.start_time if self.start_time else 0.0
             self.logger.error(f"Error executing process {self.process.pid}: {e}")
 
             return ProcessResult(
@@ -25,7 +25,7 @@ import multiprocessing
 import re
 import threading
 import time
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from concurrent.futures import (
     ThreadPoolExecutor,
     TimeoutError as FuturesTimeoutError,
@@ -35,6 +35,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from ipaddress import AddressValueError, NetmaskValueError, ip_network
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
@@ -52,6 +53,12 @@ try:
 except ImportError:
     SQLITE_AVAILABLE = False
 
+# VRP file metadata keyed on (resolved path, mtime_ns, size) so that building
+# another validator over an unchanged JSON file does not re-parse the whole file
+_VRP_METADATA_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_VRP_METADATA_CACHE_MAX = 8
+_vrp_metadata_cache_lock = threading.Lock()
+
 
 class ThreadHealthMonitor:
     """Monitor health and performance of worker threads with watchdog functionality"""
@@ -60,16 +67,17 @@ class ThreadHealthMonitor:
         self.max_workers = max_workers
         self.thread_stats = {}
         self.lock = threading.Lock()
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.watchdog_active = False
         self.watchdog_thread = None
 
     def register_thread(self, thread_id: str) -> None:
         """Register a new worker thread"""
+        now = time.perf_counter()
         with self.lock:
             self.thread_stats[thread_id] = {
-                "start_time": time.time(),
-                "last_heartbeat": time.time(),
+                "start_time": now,
+                "last_heartbeat": now,
                 "operations": 0,
                 "errors": 0,
                 "timeouts": 0,
@@ -83,7 +91,7 @@ class ThreadHealthMonitor:
         with self.lock:
             if thread_id in self.thread_stats:
                 stats = self.thread_stats[thread_id]
-                stats["last_heartbeat"] = time.time()
+                stats["last_heartbeat"] = time.perf_counter()
                 stats["operations"] += 1
                 if not operation_success:
                     stats["errors"] += 1
@@ -106,7 +114,7 @@ class ThreadHealthMonitor:
     def get_unhealthy_threads(self, max_silence: float = 30.0) -> List[str]:
         """Get list of threads that appear unhealthy"""
         unhealthy = []
-        current_time = time.time()
+        current_time = time.perf_counter()
 
         with self.lock:
             for thread_id, stats in self.thread_stats.items():
@@ -137,7 +145,7 @@ class ThreadHealthMonitor:
                 "total_timeouts": total_timeouts,
                 "error_rate": total_errors / max(1, total_ops),
                 "status_counts": status_counts,
-                "runtime": time.time() - self.start_time,
+                "runtime": time.perf_counter() - self.start_time,
             }
 
     def start_watchdog(
@@ -278,7 +286,7 @@ class VRPEntry:
             return False
 
 
-@dataclass
+@dataclass(slots=True)
 class RPKIValidationResult:
     """Result of RPKI validation for a prefix-AS pair"""
 
@@ -341,10 +349,27 @@ class StreamingVRPProcessor:
 
         try:
             if self._file_format == "json":
+                stat = self.cache_path.stat()
+                cache_key = (str(self.cache_path.resolve()), stat.st_mtime_ns, stat.st_size)
+                with _vrp_metadata_cache_lock:
+                    cached = _VRP_METADATA_CACHE.get(cache_key)
+                if cached is not None:
+                    return cached.copy()
+
                 with open(self.cache_path, "r") as f:
                     # Load only first part to get metadata
                     data = json.load(f)
-                    return data.get("metadata", {})
+                    metadata = data.get("metadata", {})
+
+                with _vrp_metadata_cache_lock:
+                    # Drop stale entries for this path before inserting the fresh parse
+                    for key in [k for k in _VRP_METADATA_CACHE if k[0] == cache_key[0]]:
+                        del _VRP_METADATA_CACHE[key]
+                    while len(_VRP_METADATA_CACHE) >= _VRP_METADATA_CACHE_MAX:
+                        del _VRP_METADATA_CACHE[next(iter(_VRP_METADATA_CACHE))]
+                    _VRP_METADATA_CACHE[cache_key] = metadata.copy()
+
+                return metadata
             else:
                 # CSV format doesn't typically have metadata
                 return {"source_format": "csv"}
@@ -1321,10 +1346,10 @@ class RPKIValidator:
             # Extract all prefixes from policy content
             prefixes = self._extract_prefixes_from_policy(content)
 
-            # Validate each prefix
+            # Validate each prefix, resolving the method once rather than per prefix
+            validate = self.validate_prefix_origin
             for prefix in prefixes:
-                result = self.validate_prefix_origin(prefix, as_number)
-                results.append(result)
+                results.append(validate(prefix, as_number))
 
         except Exception as e:
             self.logger.error(f"Error validating policy prefixes: {e}")
@@ -1369,7 +1394,8 @@ class RPKIValidator:
             self.logger.debug(
                 f"Using sequential validation for {len(prefixes)} prefixes (small dataset)"
             )
-            return [self.validate_prefix_origin(prefix, asn) for prefix in prefixes]
+            validate = self.validate_prefix_origin
+            return [validate(prefix, asn) for prefix in prefixes]
 
         # Parallel processing for larger datasets
         self.logger.debug(
@@ -1697,11 +1723,11 @@ class RPKIValidator:
             List of validation results for the chunk
         """
         results = []
+        validate = self.validate_prefix_origin
         for prefix in prefix_chunk:
             try:
                 # VRP dataset is read-only after initialization, so this is thread-safe
-                result = self.validate_prefix_origin(prefix, asn)
-                results.append(result)
+                results.append(validate(prefix, asn))
             except Exception as e:
                 # Individual prefix error shouldn't break the batch
                 error_result = RPKIValidationResult(
@@ -2342,10 +2368,10 @@ class RPKIGuardrail(GuardrailComponent):
         self, validation_results: List["RPKIValidationResult"]
     ) -> Dict[str, int]:
         """
-        Compute validation statistics in a single pass for optimal performance.
+        Compute validation statistics with C-level counting.
 
-        Replaces 5 separate sum() comprehensions with a single iteration,
-        providing 10-15% performance improvement for large validation datasets.
+        States are tallied by Counter over an attrgetter map, so the per-result
+        work never runs the Python interpreter loop or an if/elif cascade.
 
         Args:
             validation_results: List of RPKIValidationResult objects
@@ -2360,34 +2386,16 @@ class RPKIGuardrail(GuardrailComponent):
                 'allowlisted': allowlisted prefix count
             }
         """
-        stats = {
-            "total": 0,
-            "valid": 0,
-            "invalid": 0,
-            "notfound": 0,
-            "error": 0,
-            "allowlisted": 0,
-        }
+        state_counts = Counter(map(attrgetter("state"), validation_results))
 
-        # Single-pass aggregation over validation results
-        for result in validation_results:
-            stats["total"] += 1
-
-            # Count by RPKI state
-            if result.state == RPKIState.VALID:
-                stats["valid"] += 1
-            elif result.state == RPKIState.INVALID:
-                stats["invalid"] += 1
-            elif result.state == RPKIState.NOTFOUND:
-                stats["notfound"] += 1
-            elif result.state == RPKIState.ERROR:
-                stats["error"] += 1
-
-            # Count allowlisted prefixes
-            if result.allowlisted:
-                stats["allowlisted"] += 1
-
-        return stats
+        return {
+            "total": len(validation_results),
+            "valid": state_counts[RPKIState.VALID],
+            "invalid": state_counts[RPKIState.INVALID],
+            "notfound": state_counts[RPKIState.NOTFOUND],
+            "error": state_counts[RPKIState.ERROR],
+            "allowlisted": sum(map(attrgetter("allowlisted"), validation_results)),
+        }
 
     def _get_rpki_action(self, passed: bool, risk_level: str, issues: List[str]) -> str:
         """Get recommended action for RPKI validation results"""
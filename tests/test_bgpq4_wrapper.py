@@ -0,0 +1,94 @@
+"""
+Tests for BGPq4Wrapper parallel generation and its persistent worker pool
+"""
+
+import logging
+import os
+import stat
+
+import pytest
+
+from otto_bgp.generators.bgpq4_wrapper import BGPq4Mode, BGPq4Wrapper
+
+# AS number that makes the fake bgpq4 kill the worker process running it
+CRASH_AS = 64999
+# AS number that makes the fake bgpq4 exit with an error
+FAIL_AS = 64998
+
+FAKE_BGPQ4 = """#!/bin/sh
+# Last argument is the AS (e.g. AS64512); the policy name follows -l
+for arg; do as="$arg"; done
+if [ "$as" = "AS{crash_as}" ]; then
+    kill -9 $PPID
+    exit 1
+fi
+if [ "$as" = "AS{fail_as}" ]; then
+    echo "no such object" >&2
+    exit 3
+fi
+echo "$as $PPID" >> "{pid_log}"
+sleep 0.2
+echo "policy-options {{"
+echo "replace:"
+echo " prefix-list $as {{"
+echo "    192.0.2.0/24;"
+echo " }}"
+echo "}}"
+"""
+
+
+@pytest.fixture
+def fake_bgpq4(tmp_path, monkeypatch):
+    """Fake native bgpq4 that records which process ran it for each AS"""
+    monkeypatch.setenv("OTTO_DB_PATH", str(tmp_path / "otto.db"))
+    monkeypatch.delenv("OTTO_BGP_BGPQ4_MAX_WORKERS", raising=False)
+
+    pid_log = tmp_path / "worker_pids.log"
+    script = tmp_path / "bgpq4"
+    script.write_text(FAKE_BGPQ4.format(crash_as=CRASH_AS, fail_as=FAIL_AS, pid_log=pid_log))
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return script, pid_log
+
+
+def test_batch_after_worker_crash_runs_in_fresh_pool(fake_bgpq4):
+    """A worker killed mid-batch must not push the next batch onto the sequential fallback"""
+    script, pid_log = fake_bgpq4
+    wrapper = BGPq4Wrapper(mode=BGPq4Mode.NATIVE, native_bgpq4_path=str(script), enable_cache=False)
+
+    try:
+        first = wrapper.generate_policies_parallel([CRASH_AS, 64601, 64602], max_workers=2)
+        crashed = next(r for r in first.results if r.as_number == CRASH_AS)
+        assert not crashed.success
+        # The dead pool is dropped rather than kept for the next batch
+        assert wrapper._executor is None
+
+        second_as = [64701, 64702, 64703, 64704]
+        second_names = {f"AS{as_number}" for as_number in second_as}
+        second = wrapper.generate_policies_parallel(second_as, max_workers=2)
+
+        assert second.successful_count == len(second_as)
+        worker_pids = {
+            int(pid) for as_name, pid in (line.split() for line in pid_log.read_text().splitlines()) if as_name in second_names
+        }
+        # Sequential fallback would run bgpq4 from this process and drop the pool
+        assert os.getpid() not in worker_pids
+        assert len(worker_pids) == 2
+        assert wrapper._executor is not None
+    finally:
+        wrapper.close()
+
+
+def test_worker_log_records_reach_parent_handlers(fake_bgpq4, caplog):
+    """Records logged inside worker processes are emitted by the parent's handlers"""
+    script, _ = fake_bgpq4
+    caplog.set_level(logging.INFO)
+    wrapper = BGPq4Wrapper(mode=BGPq4Mode.NATIVE, native_bgpq4_path=str(script), enable_cache=False)
+
+    try:
+        wrapper.generate_policies_parallel([FAIL_AS, 64801], max_workers=2)
+    finally:
+        wrapper.close()
+
+    worker_records = [r for r in caplog.records if r.process != os.getpid()]
+    assert any(r.levelno == logging.INFO and "Generating policy for AS64801" in r.getMessage() for r in worker_records)
+    assert any(r.levelno >= logging.WARNING and f"AS{FAIL_AS}" in r.getMessage() for r in worker_records)
@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 from jwt import exceptions as jwt_exceptions
 from passlib.hash import bcrypt
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from webui.core.audit import audit_log
 from webui.core.security import (
@@ -18,6 +19,7 @@ from webui.core.security import (
     get_jwt_secret,
 )
 from webui.core.users import get_user
+from webui.settings import OTTO_WEBUI_COOKIE_SECURE
 
 logger = logging.getLogger("otto.webui")
 router = APIRouter()
@@ -35,10 +37,11 @@ async def login(request: Request, data: LoginRequest):
         username = data.username
         password = data.password
 
-        # Get user and verify password
+        # Get user and verify password; bcrypt is deliberately slow, so it
+        # runs off the event loop instead of stalling every other request
         user = get_user(username)
-        if not user or not bcrypt.verify(
-                password, user.get('password_hash', '')):
+        if not user or not await run_in_threadpool(
+                bcrypt.verify, password, user.get('password_hash', '')):
             audit_log("login_failed", user=username, result="failed")
             return JSONResponse(
                 {'error': 'Invalid credentials'}, status_code=401)
@@ -60,7 +63,7 @@ async def login(request: Request, data: LoginRequest):
             key="otto_refresh_token",
             value=refresh_token,
             httponly=True,
-            secure=True,
+            secure=OTTO_WEBUI_COOKIE_SECURE,
             samesite="strict",
             max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
         )
@@ -112,7 +115,7 @@ async def refresh_token(request: Request):
             key="otto_refresh_token",
             value=new_refresh_token,
             httponly=True,
-            secure=True,
+            secure=OTTO_WEBUI_COOKIE_SECURE,
             samesite="strict",
             max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
         )
@@ -139,7 +142,7 @@ async def logout(user: dict = Depends(get_current_user)):
         key="otto_refresh_token",
         value="",
         httponly=True,
-        secure=True,
+        secure=OTTO_WEBUI_COOKIE_SECURE,
         samesite="strict",
         max_age=0  # Expire immediately
     )
@@ -1,14 +1,14 @@
 import json
-import tempfile
 from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from webui.core.audit import audit_log
 from webui.core.config_io import (
+    deep_merge,
     load_config,
     load_config_json_only,
     normalize_email_addresses,
@@ -16,6 +16,7 @@ from webui.core.config_io import (
     save_config,
     sync_config_to_otto_env,
     update_core_email_config,
+    validate_email_config,
 )
 from webui.core.fileops import create_timestamped_backup, restore_backup
 from webui.core.security import require_role
@@ -179,7 +180,6 @@ async def update_config(request: Request,
             )
 
     # Merge new config with existing config to prevent data loss
-    from webui.core.config_io import deep_merge
     existing_config = load_config_json_only()
     merged_config = deep_merge(existing_config, new_config)
 
@@ -225,9 +225,8 @@ async def validate_config(request: Request,
 async def test_smtp(config: SMTPTest,
                     user: dict = Depends(require_role("admin"))):
     """Validate email configuration schema"""
-    smtp_dict = config.dict()
-    from webui.core.config_io import validate_email_config as _v
-    issues = _v(smtp_dict)
+    smtp_dict = config.model_dump()
+    issues = validate_email_config(smtp_dict)
 
     # Additional validation for email addresses
     if 'to_addresses' in smtp_dict:
@@ -421,14 +420,9 @@ async def export_config(user: dict = Depends(require_role("read_only"))):
         config = load_config()
         redacted = redact_sensitive_fields(config)
 
-        # Create temporary file with exported config
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.json',
-            delete=False
-        ) as tmp:
-            json.dump(redacted, tmp, indent=2)
-            tmp_path = tmp.name
+        # Serialize in memory; the export is small and a temp file would
+        # never be cleaned up after the response is sent
+        content = json.dumps(redacted, indent=2)
 
         # Create filename with timestamp
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
@@ -440,10 +434,9 @@ async def export_config(user: dict = Depends(require_role("read_only"))):
             resource=filename
         )
 
-        return FileResponse(
-            tmp_path,
+        return Response(
+            content=content,
             media_type='application/json',
-            filename=filename,
             headers={
                 'Content-Disposition': f'attachment; filename="{filename}"'
             }
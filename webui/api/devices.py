@@ -31,7 +31,7 @@ async def create_device_endpoint(
 ):
     """Create new device"""
     try:
-        device = create_device(device_data.dict())
+        device = create_device(device_data.model_dump())
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     audit_log("device_added", user=user.get("sub"), resource=device_data.hostname)
@@ -45,7 +45,7 @@ async def update_device_endpoint(
     user: dict = Depends(require_role("admin"))
 ):
     """Update device"""
-    updated = update_device(address, device_data.dict())
+    updated = update_device(address, device_data.model_dump())
     if not updated:
         raise HTTPException(status_code=404, detail="Device not found")
     audit_log("device_updated", user=user.get("sub"), resource=address)
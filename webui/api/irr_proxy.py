@@ -2,6 +2,7 @@
 import subprocess
 
 from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from webui.core.audit import audit_log
 from webui.core.security import require_role
@@ -22,8 +23,10 @@ def head_tail(s: str, n: int = 400) -> str:
 async def test_proxy(user: dict = Depends(require_role('admin'))):
     """Test IRR proxy connectivity by running otto-bgp test-proxy command"""
     try:
-        # Run the otto-bgp test-proxy command
-        result = subprocess.run(
+        # Run the otto-bgp test-proxy command in a worker thread so the
+        # event loop keeps serving other requests for up to the full timeout
+        result = await run_in_threadpool(
+            subprocess.run,
             ['./otto-bgp', 'test-proxy', '--test-bgpq4', '-v'],
             capture_output=True,
             text=True,
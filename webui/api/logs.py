@@ -1,3 +1,6 @@
+import json
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from webui.core.audit import audit_log
@@ -6,26 +9,28 @@ from webui.core.security import require_role
 
 router = APIRouter()
 
+# UI service filter to systemd unit
+SERVICE_UNITS = {
+    "otto-bgp": "otto-bgp.service",
+    "webui": "otto-bgp-webui-adapter.service",
+    "rpki": "otto-bgp-rpki-update.service",
+    "rpki-client": "rpki-client.service",
+    "rpki-preflight": "otto-bgp-rpki-preflight.service"
+}
+
+# journald PRIORITY (syslog severity 0-7) to UI log level
+PRIORITY_LEVELS = ("error", "error", "error", "error", "warning", "info", "info", "success")
+
 
 @router.get("")
 async def get_system_logs(
     service: str = "all", level: str = "all", limit: int = 100,
     user: dict = Depends(require_role("read_only"))
 ):
-    import json
-    from datetime import datetime
-    
     # Get journalctl logs for the specified service
     unit = None
     if service != "all":
-        unit_map = {
-            "otto-bgp": "otto-bgp.service",
-            "webui": "otto-bgp-webui-adapter.service",
-            "rpki": "otto-bgp-rpki-update.service",
-            "rpki-client": "rpki-client.service",
-            "rpki-preflight": "otto-bgp-rpki-preflight.service"
-        }
-        unit = unit_map.get(service)
+        unit = SERVICE_UNITS.get(service)
     
     lines = get_journalctl_logs(unit, limit)
     
@@ -44,14 +49,10 @@ async def get_system_logs(
                     priority = int(priority)
                 except (ValueError, TypeError):
                     priority = 6
-            if priority <= 3:
-                level_str = "error"
-            elif priority == 4:
-                level_str = "warning"
-            elif priority == 7:
-                level_str = "success"
+            if 0 <= priority <= 7:
+                level_str = PRIORITY_LEVELS[priority]
             else:
-                level_str = "info"
+                level_str = "error" if priority < 0 else "info"
             
             # Skip if level filter doesn't match
             if level != "all" and level_str != level:
@@ -61,9 +62,7 @@ async def get_system_logs(
             service_name = "system"
             if entry.get("_SYSTEMD_UNIT"):
                 service_name = entry["_SYSTEMD_UNIT"].replace(".service", "").replace("otto-bgp-", "")
-                if service_name == "otto-bgp":
-                    service_name = "otto-bgp"
-                elif service_name == "webui-adapter":
+                if service_name == "webui-adapter":
                     service_name = "webui"
             elif entry.get("SYSLOG_IDENTIFIER"):
                 service_name = entry["SYSLOG_IDENTIFIER"]
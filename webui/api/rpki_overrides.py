@@ -177,7 +177,7 @@ async def bulk_update(
 
     try:
         mgr = RPKIOverrideManager()
-        ops_list = [op.dict() for op in operations]
+        ops_list = [op.model_dump() for op in operations]
         result = mgr.bulk_update(ops_list, user.get("sub", "unknown"))
 
         audit_log(
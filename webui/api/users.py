@@ -56,7 +56,7 @@ async def update_user_endpoint(
     user: dict = Depends(require_role("admin"))
 ):
     """Update user"""
-    update_dict = {k: v for k, v in updates.dict().items() if v is not None}
+    update_dict = {k: v for k, v in updates.model_dump().items() if v is not None}
     try:
         updated = update_user(username, update_dict)
     except (ValueError, PermissionError) as e:
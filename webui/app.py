@@ -7,7 +7,7 @@ from fastapi.staticfiles import StaticFiles
 
 from webui.core.audit import setup_audit_logging
 from webui.core.security import needs_setup
-from webui.settings import OTTO_WEBUI_LOG_LEVEL, WEBUI_ROOT
+from webui.settings import OTTO_WEBUI_COOKIE_SECURE, OTTO_WEBUI_LOG_LEVEL, WEBUI_ROOT
 
 # Setup logging
 logger = logging.getLogger("otto.webui")
@@ -31,6 +31,9 @@ def create_app() -> FastAPI:
         docs_url=None,  # Disable auto docs in production
         redoc_url=None
     )
+
+    if not OTTO_WEBUI_COOKIE_SECURE:
+        logger.warning("OTTO_WEBUI_COOKIE_SECURE is disabled; refresh cookie will be sent over plain HTTP")
     
     @app.middleware("http")
     async def add_security_headers(request: Request, call_next):
@@ -1,12 +1,18 @@
+import atexit
 import logging
+import queue
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 from webui.settings import DATA_DIR
 
+# Background listener that owns the audit file handler
+_audit_listener = None
+
 
 def setup_audit_logging():
     """Initialize audit logger with plain text formatter"""
+    global _audit_listener
     audit_logger = logging.getLogger("otto.audit")
     audit_logger.setLevel(logging.INFO)
     
@@ -44,7 +50,14 @@ def setup_audit_logging():
                 return f"{timestamp} - AUDIT - {' | '.join(parts)}"
         
         handler.setFormatter(AuditFormatter())
-        audit_logger.addHandler(handler)
+
+        # Request handlers only enqueue the record; a listener thread performs
+        # the file write and rotation, and drains the queue at interpreter exit
+        audit_queue = queue.SimpleQueue()
+        _audit_listener = QueueListener(audit_queue, handler, respect_handler_level=True)
+        _audit_listener.start()
+        atexit.register(_audit_listener.stop)
+        audit_logger.addHandler(QueueHandler(audit_queue))
     return audit_logger
 
 # Initialize at module level
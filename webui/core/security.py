@@ -1,6 +1,7 @@
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 import jwt
 from fastapi import Depends, HTTPException, Request
@@ -13,12 +14,27 @@ JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 5
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Secret file contents keyed on (mtime_ns, size); every authenticated request
+# needs the secret, and a rotated file is picked up on the next call
+_jwt_secret_cache: Optional[Tuple[Tuple[int, int], str]] = None
+_jwt_secret_lock = threading.Lock()
+
 
 def get_jwt_secret() -> str:
     """Load JWT secret from file (dev fallback only if enabled)"""
+    global _jwt_secret_cache
     try:
         if JWT_SECRET_PATH.exists():
-            return JWT_SECRET_PATH.read_text().strip()
+            stat = JWT_SECRET_PATH.stat()
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            with _jwt_secret_lock:
+                cached = _jwt_secret_cache
+            if cached is not None and cached[0] == cache_key:
+                return cached[1]
+            secret = JWT_SECRET_PATH.read_text().strip()
+            with _jwt_secret_lock:
+                _jwt_secret_cache = (cache_key, secret)
+            return secret
     except Exception as e:
         logging.getLogger("otto.webui").error(
             f"Failed to read JWT secret: {e}")
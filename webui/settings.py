@@ -21,4 +21,5 @@ JWT_SECRET_PATH = CONFIG_DIR / '.jwt_secret'
 OTTO_DEV_MODE = os.getenv('OTTO_DEV_MODE', 'false').lower() == 'true'
 OTTO_WEBUI_LOG_LEVEL = os.getenv('OTTO_WEBUI_LOG_LEVEL', 'INFO').upper()
 OTTO_WEBUI_ENABLE_SERVICE_CONTROL = os.getenv('OTTO_WEBUI_ENABLE_SERVICE_CONTROL', 'false').lower() == 'true'
-
+# Refresh cookie Secure flag; only an explicit opt-out disables it (plain-HTTP local development or profiling)
+OTTO_WEBUI_COOKIE_SECURE = os.getenv('OTTO_WEBUI_COOKIE_SECURE', 'true').strip().lower() not in ('false', '0', 'no', 'off')